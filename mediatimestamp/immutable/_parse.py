@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 from typing import Tuple
 
 from ..exceptions import TsValueError
 from ..constants import MAX_NANOSEC
 
+# YYYY-MM-DDThh:mm:ss with an optional fraction. Only the first 9 fraction digits are kept, and anything after them is
+# ignored apart from a further '.', ':' or 'T', matching the field splitting and _parse_seconds_fraction
+_ISO8601_RE = re.compile(r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)(?:\.([0-9]{0,9})[^.:T]*)?\Z')
+
 
 def _parse_seconds_fraction(frac: str) -> int:
     """ Parse the fraction part of a timestamp seconds, using maximum 9 digits
@@ -36,18 +41,9 @@ def _parse_iso8601(iso8601: str) -> Tuple[int, int, int, int, int, int, int]:
     """ Limited ISO 8601 timestamp parse; expands YYYY-MM-DDThh:mm:ss.s
     Returns tuple of (year, month, day, hours, mins, seconds, nanoseconds)
     """
-    iso_date_time = iso8601.split("T")
-    if len(iso_date_time) != 2:
-        raise TsValueError("invalid or unsupported ISO 8601 UTC format")
-    iso_date = iso_date_time[0].split("-")
-    iso_time = iso_date_time[1].split(":")
-    if len(iso_date) != 3 or len(iso_time) != 3:
+    m = _ISO8601_RE.match(iso8601)
+    if m is None:
         raise TsValueError("invalid or unsupported ISO 8601 UTC format")
-    sec_frac = iso_time[2].split(".")
-    if len(sec_frac) != 1 and len(sec_frac) != 2:
-        raise TsValueError("invalid or unsupported ISO 8601 UTC format")
-    sec = sec_frac[0]
-    ns = 0
-    if len(sec_frac) > 1:
-        ns = _parse_seconds_fraction(sec_frac[1])
-    return (int(iso_date[0]), int(iso_date[1]), int(iso_date[2]), int(iso_time[0]), int(iso_time[1]), int(sec), ns)
+    year, month, day, hour, minute, sec, frac = m.groups()
+    ns = int(frac.ljust(9, "0")) if frac else 0
+    return (int(year), int(month), int(day), int(hour), int(minute), int(sec), ns)
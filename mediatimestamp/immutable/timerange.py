@@ -26,6 +26,13 @@ from .timestamp import Timestamp, SupportsMediaTimestamp, mediatimestamp
 __all__ = ["TimeRange", "SupportsMediaTimeRange", "mediatimerange"]
 
 
+# Grammar accepted by TimeRange.from_str, compiled once at import
+_TIMERANGE_RE = re.compile(r'(\[|\()?([^_\)\]]+)?(_([^_\)\]]+)?)?(\]|\))?')
+
+# Timestamps are immutable, so the zero used to normalise empty ranges and check lengths can be shared
+_ZERO_TIMESTAMP = Timestamp()
+
+
 if TYPE_CHECKING:
     @runtime_checkable
     class SupportsMediaTimeRange (Protocol):
@@ -123,8 +130,8 @@ class TimeRange (object):
         # Normalise the 'never' cases
         if start is not None and end is not None:
             if start > end or (start == end and inclusivity != TimeRange.INCLUSIVE):
-                start = Timestamp()
-                end = Timestamp()
+                start = _ZERO_TIMESTAMP
+                end = _ZERO_TIMESTAMP
                 inclusivity = TimeRange.EXCLUSIVE
 
         # Normalise the 'eternity' cases
@@ -153,7 +160,7 @@ class TimeRange (object):
     def at_rate(self,
                 numerator: RationalTypes,
                 denominator: RationalTypes = 1,
-                phase_offset: SupportsMediaTimestamp = Timestamp()) -> Iterator[Timestamp]:
+                phase_offset: SupportsMediaTimestamp = _ZERO_TIMESTAMP) -> Iterator[Timestamp]:
         """Returns an iterable which yields Timestamp objects at the specified rate within the
         range starting at the beginning and moving later.
 
@@ -191,7 +198,7 @@ class TimeRange (object):
     def reversed_at_rate(self,
                          numerator: RationalTypes,
                          denominator: RationalTypes = 1,
-                         phase_offset: SupportsMediaTimestamp = Timestamp()) -> Iterator[Timestamp]:
+                         phase_offset: SupportsMediaTimestamp = _ZERO_TIMESTAMP) -> Iterator[Timestamp]:
         """Returns an iterable which yields Timestamp objects at the specified rate within the
         range starting at the end and moving earlier.
 
@@ -264,7 +271,7 @@ class TimeRange (object):
         :raises: TsValueError if the length is negative"""
         length = mediatimestamp(length)
         start = mediatimestamp(start)
-        if length < Timestamp():
+        if length < _ZERO_TIMESTAMP:
             raise TsValueError("Length must be non-negative")
         return cls(start, start + length, inclusivity)
 
@@ -276,7 +283,9 @@ class TimeRange (object):
     @classmethod
     def never(cls) -> "TimeRange":
         """Return a time range covering no time"""
-        return cls(Timestamp(), Timestamp(), TimeRange.EXCLUSIVE)
+        if cls is TimeRange:
+            return _NEVER
+        return cls(_ZERO_TIMESTAMP, _ZERO_TIMESTAMP, TimeRange.EXCLUSIVE)
 
     @classmethod
     def from_single_timestamp(cls, ts: SupportsMediaTimestamp) -> "TimeRange":
@@ -311,7 +320,7 @@ class TimeRange (object):
 
         :param s: The string to process
         """
-        m = re.match(r'(\[|\()?([^_\)\]]+)?(_([^_\)\]]+)?)?(\]|\))?', s)
+        m = _TIMERANGE_RE.match(s)
 
         if m is None:
             raise ValueError("{!r} is not a valid TimeRange".format(s))
@@ -383,6 +392,8 @@ class TimeRange (object):
                       (self.inclusivity & TimeRange.INCLUDE_END == 0))))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, SupportsMediaTimeRange):
             return False
 
@@ -827,3 +838,7 @@ class TimeRange (object):
             # If we have just yielded the final chunk, then this will produce an empty timerange.
             remainder = remainder.intersect_with(next_timerange.timerange_after())
         return
+
+
+# The single empty range handed out by TimeRange.never(), so that it can be compared by identity
+_NEVER = TimeRange(_ZERO_TIMESTAMP, _ZERO_TIMESTAMP, TimeRange.EXCLUSIVE)
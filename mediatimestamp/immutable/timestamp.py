@@ -12,20 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple, Optional, Type, TYPE_CHECKING, Protocol, runtime_checkable, Union
+from typing import Tuple, Optional, Type, TYPE_CHECKING, Protocol, runtime_checkable, Union, Callable, cast
 from abc import ABCMeta, abstractmethod
+import bisect
 import calendar
 import time
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil import tz
 from fractions import Fraction
+from functools import lru_cache
 
 from deprecated import deprecated
 
 from ..constants import MAX_NANOSEC, MAX_SECONDS, UTC_LEAP
 from ..exceptions import TsValueError
 
+from ._civil import _days_from_civil, _civil_from_days
 from ._parse import _parse_seconds_fraction, _parse_iso8601
 from ._types import RationalTypes
 
@@ -37,6 +40,21 @@ __all__ = ["Timestamp", "SupportsMediaTimestamp", "mediatimestamp", "TimestampCo
 
 TimestampConstructionType = Union["Timestamp", "SupportsMediaTimestamp", int, float]
 
+# Grammar accepted by Timestamp.from_smpte_timelabel, compiled once at import
+_SMPTE_TIMELABEL_RE = re.compile(
+    r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)F(\d+) (\d+)/(\d+) UTC([-\+])(\d+):(\d+) TAI([-\+])(\d+)')
+
+# UTC_LEAP flattened into ascending tuples so that leap second lookups can bisect rather than scan
+_LEAP_UNIX_BOUNDARIES = tuple(unix_sec for (unix_sec, _) in reversed(UTC_LEAP))
+_LEAP_TAI_BOUNDARIES = tuple(tai_sec_minus_1 for (_, tai_sec_minus_1) in reversed(UTC_LEAP))
+_LEAP_VALUES = tuple((tai_sec_minus_1 + 1) - unix_sec for (unix_sec, tai_sec_minus_1) in reversed(UTC_LEAP))
+
+
+# Sample rates reduced to Fractions. Callers use only a handful of distinct rates, so the reduced values are kept
+# rather than being worked out again on every conversion (the cast is because Rational is not typed as Hashable).
+# The cache is typed so that a float rate never hits the entry for an equal int and still fails as Fraction does
+_rate_fraction = cast(Callable[[RationalTypes, RationalTypes], Fraction], lru_cache(maxsize=32, typed=True)(Fraction))
+
 
 if TYPE_CHECKING:
     @runtime_checkable
@@ -113,12 +131,12 @@ class Timestamp(object):
     @property
     def sec(self) -> int:
         """Returns the whole number of seconds"""
-        return int(abs(self._value) // self.MAX_NANOSEC)
+        return abs(self._value) // self.MAX_NANOSEC
 
     @property
     def ns(self) -> int:
         """Returns the nanoseconds remainder after subtrating the whole number of seconds"""
-        return abs(self._value) - self.sec * self.MAX_NANOSEC
+        return abs(self._value) % self.MAX_NANOSEC
 
     @property
     def sign(self) -> int:
@@ -173,7 +191,7 @@ class Timestamp(object):
         if factor < 1:
             raise TsValueError("invalid interval factor")
 
-        rate = Fraction(rate_num, rate_den)
+        rate = _rate_fraction(rate_num, rate_den)
         ns = int((cls.MAX_NANOSEC * rate.denominator) // (rate.numerator * factor))
         return cls(ns=ns)
 
@@ -241,20 +259,23 @@ class Timestamp(object):
 
     @classmethod
     def from_datetime(cls, dt: datetime) -> "Timestamp":
-        minTs = datetime.fromtimestamp(0, tz.gettz('UTC'))
-        utcdt = dt.astimezone(tz.gettz('UTC'))
-        seconds = abs(int((utcdt - minTs).total_seconds()))
-        nanoseconds = utcdt.microsecond * 1000
-        if utcdt < minTs:
+        offset = dt.utcoffset()
+        if offset is None:
+            # A naive datetime is in local time, so let datetime work out the offset
+            dt = dt.astimezone(tz.gettz('UTC'))
+            offset = timedelta(0)
+
+        # Work in whole microseconds from the calendar fields rather than going through floating point seconds
+        seconds = _days_from_civil(dt.year, dt.month, dt.day) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        microseconds = seconds * 1000000 + dt.microsecond - offset // timedelta(microseconds=1)
+        if microseconds < 0:
             sign = -1
-            if nanoseconds > 0:
-                # The microseconds was for a positive date-time. In a negative
-                # unix time it needs to be flipped.
-                nanoseconds = cls.MAX_NANOSEC - nanoseconds
+            microseconds = -microseconds
         else:
             sign = 1
+        seconds, microseconds = divmod(microseconds, 1000000)
 
-        return cls.from_unix(unix_sec=seconds, unix_ns=nanoseconds, unix_sign=sign, is_leap=False)
+        return cls.from_unix(unix_sec=seconds, unix_ns=microseconds * 1000, unix_sign=sign, is_leap=False)
 
     @classmethod
     def from_iso8601_utc(cls, iso8601utc: str) -> "Timestamp":
@@ -278,15 +299,17 @@ class Timestamp(object):
 
     @classmethod
     def from_smpte_timelabel(cls, timelabel: str) -> "Timestamp":
-        r = re.compile(r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)F(\d+) (\d+)/(\d+) UTC([-\+])(\d+):(\d+) TAI([-\+])(\d+)')
-        m = r.match(timelabel)
+        m = _SMPTE_TIMELABEL_RE.match(timelabel)
         if m is None:
             raise TsValueError("invalid SMPTE Time Label string format")
         groups = m.groups()
+        if not 1 <= int(groups[0]) <= 9999:
+            raise TsValueError("invalid SMPTE Time Label year")
+        if not 1 <= int(groups[1]) <= 12:
+            raise TsValueError("invalid SMPTE Time Label month")
         leap_sec = int(int(groups[5]) == 60)
-        local_tm_sec = calendar.timegm(time.struct_time((int(groups[0]), int(groups[1]), int(groups[2]),
-                                                         int(groups[3]), int(groups[4]), int(groups[5]) - leap_sec,
-                                                         0, 0, 0)))
+        local_tm_sec = (_days_from_civil(int(groups[0]), int(groups[1]), int(groups[2])) * 86400 +
+                        int(groups[3])*60*60 + int(groups[4])*60 + int(groups[5]) - leap_sec)
         rate_num = int(groups[7])
         rate_den = int(groups[8])
         utc_sign = 1
@@ -338,7 +361,7 @@ class Timestamp(object):
         sign = 1
         if count < 0:
             sign = -1
-        rate = Fraction(rate_num, rate_den)
+        rate = _rate_fraction(rate_num, rate_den)
         ns = (cls.MAX_NANOSEC * abs(count) * rate.denominator) // rate.numerator
         return cls(ns=ns, sign=sign)
 
@@ -346,10 +369,9 @@ class Timestamp(object):
     def from_unix(cls, unix_sec: int, unix_ns: int, unix_sign: int = 1, is_leap: bool = False) -> "Timestamp":
         leap_sec = 0
         if unix_sign >= 0:
-            for tbl_sec, tbl_tai_sec_minus_1 in UTC_LEAP:
-                if unix_sec + is_leap >= tbl_sec:
-                    leap_sec = (tbl_tai_sec_minus_1 + 1) - tbl_sec
-                    break
+            idx = bisect.bisect_right(_LEAP_UNIX_BOUNDARIES, unix_sec + is_leap)
+            if idx:
+                leap_sec = _LEAP_VALUES[idx - 1]
         else:
             is_leap = False
         return cls(sec=unix_sec+leap_sec, ns=unix_ns, sign=unix_sign)
@@ -362,13 +384,10 @@ class Timestamp(object):
         Returns the number of leap seconds that the timestamp is adjusted by when
         converting to UTC.
         """
-        leap_sec = 0
-        for unix_sec, tai_sec_minus_1 in UTC_LEAP:
-            if self.sec >= tai_sec_minus_1:
-                leap_sec = (tai_sec_minus_1 + 1) - unix_sec
-                break
-
-        return leap_sec
+        idx = bisect.bisect_right(_LEAP_TAI_BOUNDARIES, self.sec)
+        if idx == 0:
+            return 0
+        return _LEAP_VALUES[idx - 1]
 
     def to_millisec(self, rounding: "Timestamp.Rounding" = ROUND_NEAREST) -> int:
         use_rounding = rounding
@@ -456,21 +475,22 @@ class Timestamp(object):
         if self._value < 0:
             return (self.sec, self.ns, self.sign, False)
         else:
+            sec = self.sec
             leap_sec = 0
             is_leap = False
-            for unix_sec, tai_sec_minus_1 in UTC_LEAP:
-                if self.sec >= tai_sec_minus_1:
-                    leap_sec = (tai_sec_minus_1 + 1) - unix_sec
-                    is_leap = self.sec == tai_sec_minus_1
-                    break
+            idx = bisect.bisect_right(_LEAP_TAI_BOUNDARIES, sec)
+            if idx:
+                leap_sec = _LEAP_VALUES[idx - 1]
+                is_leap = sec == _LEAP_TAI_BOUNDARIES[idx - 1]
 
-            return (self.sec - leap_sec, self.ns, self.sign, is_leap)
+            return (sec - leap_sec, self.ns, self.sign, is_leap)
 
     def to_unix_float(self) -> float:
         """ Convert to unix seconds since the epoch as a floating point number
         """
         (sec, ns, sign, _) = self.to_unix()
-        return sign * (sec + ns / Timestamp.MAX_NANOSEC)
+        # Fold to whole nanoseconds first so that there is a single, correctly rounded, division
+        return sign * (sec * Timestamp.MAX_NANOSEC + ns) / Timestamp.MAX_NANOSEC
 
     def to_iso8601_utc(self) -> str:
         """ Get printed representation in ISO8601 format (UTC)
@@ -483,17 +503,12 @@ class Timestamp(object):
             # it needs to be flipped.
             unix_ns = Timestamp.MAX_NANOSEC - unix_ns
             unix_s += 1
-        utc_bd = time.gmtime(unix_sign * unix_s)
-        frac_sec = Timestamp(ns=unix_ns)._get_fractional_seconds(fixed_size=True)
-        leap_sec = int(is_leap)
+        days, second_of_day = divmod(unix_sign * unix_s, 86400)
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
+        year, month, day = _civil_from_days(days)
 
-        return '%04d-%02d-%02dT%02d:%02d:%02d.%sZ' % (utc_bd.tm_year,
-                                                      utc_bd.tm_mon,
-                                                      utc_bd.tm_mday,
-                                                      utc_bd.tm_hour,
-                                                      utc_bd.tm_min,
-                                                      utc_bd.tm_sec + leap_sec,
-                                                      frac_sec)
+        return '%04d-%02d-%02dT%02d:%02d:%02d.%09dZ' % (year, month, day, hour, minute, second + is_leap, unix_ns)
 
     def to_smpte_timelabel(self,
                            rate_num: RationalTypes,
@@ -501,7 +516,7 @@ class Timestamp(object):
                            utc_offset: Optional[int] = None) -> str:
         if rate_num <= 0 or rate_den <= 0:
             raise TsValueError("invalid rate")
-        rate = Fraction(rate_num, rate_den)
+        rate = _rate_fraction(rate_num, rate_den)
         count = self.to_count(rate)
         normalised_ts = Timestamp.from_count(count, rate)
         tai_seconds = normalised_ts.sec
@@ -526,7 +541,10 @@ class Timestamp(object):
         if utc_offset_sec < 0:
             utc_sign_char = '-'
 
-        utc_bd = time.gmtime(unix_sec + utc_offset_sec)
+        days, second_of_day = divmod(unix_sec + utc_offset_sec, 86400)
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
+        year, month, day = _civil_from_days(days)
 
         tai_offset = unix_sec + leap_sec - tai_seconds
         tai_sign_char = '+'
@@ -534,8 +552,8 @@ class Timestamp(object):
             tai_sign_char = '-'
 
         return '%04d-%02d-%02dT%02d:%02d:%02dF%02u %u/%u UTC%c%02u:%02u TAI%c%u' % (
-                    utc_bd.tm_year, utc_bd.tm_mon, utc_bd.tm_mday,
-                    utc_bd.tm_hour, utc_bd.tm_min, utc_bd.tm_sec + leap_sec,
+                    year, month, day,
+                    hour, minute, second + leap_sec,
                     count_within_second,
                     rate.numerator, rate.denominator,
                     utc_sign_char, utc_offset_hour, utc_offset_min,
@@ -553,7 +571,7 @@ class Timestamp(object):
         if rate_num <= 0 or rate_den <= 0:
             raise TsValueError("invalid rate")
 
-        rate = Fraction(rate_num, rate_den)
+        rate = _rate_fraction(rate_num, rate_den)
         use_rounding = rounding
         if self.sign < 0:
             if use_rounding == self.ROUND_UP:
@@ -608,24 +626,36 @@ class Timestamp(object):
         return Timestamp(self.sec, self.ns, 1)
 
     def __hash__(self) -> int:
-        return self.to_nanosec()
+        return self._value
 
+    # Comparisons between Timestamps compare the packed nanosecond values directly, and only go through compare() to
+    # convert other types
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, (int, float, Timestamp)) and self.compare(other) == 0
+        if isinstance(other, Timestamp):
+            return self._value == other._value
+        return isinstance(other, (int, float)) and self.compare(other) == 0
 
     def __ne__(self, other: object) -> bool:
         return not (self == other)
 
     def __lt__(self, other: TimestampConstructionType) -> bool:
+        if isinstance(other, Timestamp):
+            return self._value < other._value
         return self.compare(other) < 0
 
     def __le__(self, other: TimestampConstructionType) -> bool:
+        if isinstance(other, Timestamp):
+            return self._value <= other._value
         return self.compare(other) <= 0
 
     def __gt__(self, other: TimestampConstructionType) -> bool:
+        if isinstance(other, Timestamp):
+            return self._value > other._value
         return self.compare(other) > 0
 
     def __ge__(self, other: TimestampConstructionType) -> bool:
+        if isinstance(other, Timestamp):
+            return self._value >= other._value
         return self.compare(other) >= 0
 
     def __add__(self, other_in: TimestampConstructionType) -> "Timestamp":
@@ -666,16 +696,16 @@ class Timestamp(object):
         return Timestamp(ns=ns)
 
     def _get_fractional_seconds(self, fixed_size: bool = False) -> str:
-        div = self.MAX_NANOSEC // 10
-        rem = self.ns
-        sec_frac = ""
-
-        for i in range(0, 9):
-            if not fixed_size and i > 0 and rem == 0:
-                break
-
-            sec_frac += '%i' % (rem / div)
-            rem %= div
-            div //= 10
-
-        return sec_frac
+        ns = self.ns
+        if fixed_size:
+            return '%09d' % ns
+        if ns == 0:
+            return "0"
+
+        # Drop trailing zero digits arithmetically and pad what is left back out to its width
+        width = 9
+        while ns % 10 == 0:
+            ns //= 10
+            width -= 1
+
+        return '%0*d' % (width, ns)